@@ -0,0 +1,531 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Cœur de minage ECLAT compilé en C via Cython : même algorithme que le
+cœur Numba de eclat_improved.py (bitmaps / tableaux triés adaptatifs,
+parcours itératif, élagage par la matrice des supports de paires) mais
+sans démarrage JIT — memoryviews typées, __builtin_popcountll, et
+sous-arbres du niveau 1 répartis par OpenMP.
+
+Compilation : python setup.py build_ext --inplace
+"""
+
+from libc.stdlib cimport malloc, free
+from libc.string cimport memset
+from libc.stdint cimport uint64_t, uint32_t, int64_t, int32_t, int8_t
+from cython.parallel cimport prange
+
+cdef extern from *:
+    """
+    #define POPCNT64(x) __builtin_popcountll(x)
+    #define CTZ64(x) __builtin_ctzll(x)
+    """
+    int POPCNT64(uint64_t x) nogil
+    int CTZ64(uint64_t x) nogil
+
+# Mêmes constantes que eclat_improved.py
+DEF KIND_BITMAP = 0
+DEF KIND_SA = 1
+DEF KIND_DIFF = 2
+DEF GALLOP_RATIO = 32
+DEF SPARSE_WORDS_RATIO = 32
+
+
+cdef inline int64_t isect_bm_bm(uint64_t* a, uint64_t* b, uint64_t* out,
+                                uint32_t* out_nz, int32_t* out_nnz,
+                                int n_words, int64_t min_sup) noexcept nogil:
+    """AND fusionné + popcount + table des mots non nuls, sortie anticipée"""
+    cdef int64_t cnt = 0
+    cdef int32_t nnz = 0
+    cdef int k
+    cdef uint64_t w
+    for k in range(n_words):
+        w = a[k] & b[k]
+        out[k] = w
+        if w != 0:
+            out_nz[nnz] = <uint32_t>k
+            nnz += 1
+            cnt += POPCNT64(w)
+        if cnt + <int64_t>(n_words - k - 1) * 64 < min_sup:
+            out_nnz[0] = nnz
+            return -1
+    out_nnz[0] = nnz
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int64_t isect_bm_bm_sparse(uint64_t* a, uint32_t* a_nz, int32_t a_nnz,
+                                       uint64_t* b, uint64_t* out,
+                                       uint32_t* out_nz, int32_t* out_nnz,
+                                       int n_words, int64_t min_sup) noexcept nogil:
+    """Variante asymétrique : seuls les mots non nuls de a sont visités"""
+    cdef int64_t cnt = 0
+    cdef int32_t nnz = 0
+    cdef int32_t t
+    cdef int k
+    cdef uint64_t w
+    memset(out, 0, n_words * sizeof(uint64_t))
+    for t in range(a_nnz):
+        k = <int>a_nz[t]
+        w = a[k] & b[k]
+        if w != 0:
+            out[k] = w
+            out_nz[nnz] = a_nz[t]
+            nnz += 1
+            cnt += POPCNT64(w)
+        if cnt + <int64_t>(a_nnz - t - 1) * 64 < min_sup:
+            out_nnz[0] = nnz
+            return -1
+    out_nnz[0] = nnz
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int64_t bm_to_sa(uint64_t* bm, int n_words, uint32_t* out) noexcept nogil:
+    """Extraction des TIDs d'un bitmap (bit de poids faible en premier)"""
+    cdef int64_t n = 0
+    cdef int k
+    cdef uint64_t w
+    for k in range(n_words):
+        w = bm[k]
+        while w != 0:
+            out[n] = <uint32_t>(k * 64 + CTZ64(w))
+            n += 1
+            w &= w - 1
+    return n
+
+
+cdef inline int64_t isect_bm_sa(uint64_t* bm, uint32_t* sa, int64_t na,
+                                uint32_t* out, int64_t min_sup) noexcept nogil:
+    cdef int64_t cnt = 0
+    cdef int64_t i, t
+    for i in range(na):
+        t = <int64_t>sa[i]
+        if (bm[t >> 6] >> (t & 63)) & 1:
+            out[cnt] = sa[i]
+            cnt += 1
+        if cnt + (na - i - 1) < min_sup:
+            return -1
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int64_t isect_sa_merge(uint32_t* a, int64_t na, uint32_t* b, int64_t nb,
+                                   uint32_t* out, int64_t min_sup) noexcept nogil:
+    cdef int64_t ia = 0, ib = 0, cnt = 0, rem
+    cdef uint32_t va, vb
+    while ia < na and ib < nb:
+        va = a[ia]
+        vb = b[ib]
+        if va == vb:
+            out[cnt] = va
+            cnt += 1
+            ia += 1
+            ib += 1
+        elif va < vb:
+            ia += 1
+        else:
+            ib += 1
+        rem = na - ia if na - ia < nb - ib else nb - ib
+        if cnt + rem < min_sup:
+            return -1
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int64_t isect_sa_gallop(uint32_t* a, int64_t na, uint32_t* b, int64_t nb,
+                                    uint32_t* out, int64_t min_sup) noexcept nogil:
+    cdef int64_t cnt = 0, j = 0, ia, step, lo, hi, mid
+    cdef uint32_t t
+    for ia in range(na):
+        t = a[ia]
+        if j < nb and b[j] < t:
+            step = 1
+            while j + step < nb and b[j + step] < t:
+                step <<= 1
+            lo = j + (step >> 1)
+            hi = j + step if j + step < nb else nb
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                if b[mid] < t:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            j = lo
+        if j >= nb:
+            break
+        if b[j] == t:
+            out[cnt] = t
+            cnt += 1
+            j += 1
+        if cnt + (na - ia - 1) < min_sup:
+            return -1
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int64_t isect_diff_diff(uint64_t* a, uint64_t* b, uint64_t* out,
+                                    int n_words, int64_t nb_tx,
+                                    int64_t min_sup) noexcept nogil:
+    """Diffset ∩ diffset : OR des compléments, support = nb_tx - popcount"""
+    cdef int64_t cnt = 0
+    cdef int k
+    cdef uint64_t w
+    for k in range(n_words):
+        w = a[k] | b[k]
+        out[k] = w
+        cnt += POPCNT64(w)
+        if nb_tx - cnt < min_sup:
+            return -1
+    return nb_tx - cnt
+
+
+cdef inline int64_t isect_bm_diff(uint64_t* a, uint64_t* d, uint64_t* out,
+                                  uint32_t* out_nz, int32_t* out_nnz,
+                                  int n_words, int64_t min_sup) noexcept nogil:
+    """Bitmap ∩ diffset : AND-NOT fusionné (a & ~d)"""
+    cdef int64_t cnt = 0
+    cdef int32_t nnz = 0
+    cdef int k
+    cdef uint64_t w
+    for k in range(n_words):
+        w = a[k] & ~d[k]
+        out[k] = w
+        if w != 0:
+            out_nz[nnz] = <uint32_t>k
+            nnz += 1
+            cnt += POPCNT64(w)
+        if cnt + <int64_t>(n_words - k - 1) * 64 < min_sup:
+            out_nnz[0] = nnz
+            return -1
+    out_nnz[0] = nnz
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int64_t isect_sa_diff(uint32_t* sa, int64_t na, uint64_t* d,
+                                  uint32_t* out, int64_t min_sup) noexcept nogil:
+    """SA ∩ diffset : garde les TIDs absents du complément"""
+    cdef int64_t cnt = 0
+    cdef int64_t i, t
+    for i in range(na):
+        t = <int64_t>sa[i]
+        if not ((d[t >> 6] >> (t & 63)) & 1):
+            out[cnt] = sa[i]
+            cnt += 1
+        if cnt + (na - i - 1) < min_sup:
+            return -1
+    if cnt < min_sup:
+        return -1
+    return cnt
+
+
+cdef inline int32_t diff_to_bm(uint64_t* d, uint64_t* out, uint32_t* out_nz,
+                               int n_words, int64_t nb_tx) noexcept nogil:
+    """Re-matérialise le bitmap direct (complément masqué du bourrage)"""
+    cdef int32_t nnz = 0
+    cdef int k
+    cdef int tail = <int>(nb_tx & 63)
+    cdef int last = <int>((nb_tx - 1) >> 6)
+    cdef uint64_t w
+    for k in range(n_words):
+        if k > last:
+            # Mots de bourrage (lignes arrondies à la ligne de cache)
+            out[k] = 0
+            continue
+        w = ~d[k]
+        if k == last and tail != 0:
+            w &= ((<uint64_t>1) << tail) - 1
+        out[k] = w
+        if w != 0:
+            out_nz[nnz] = <uint32_t>k
+            nnz += 1
+    return nnz
+
+
+cdef inline int64_t isect_into(uint64_t* bm_i, uint32_t* sa_i, uint32_t* nz_i,
+                               int32_t nnz_i, int8_t kind_i, int64_t sup_i,
+                               uint64_t* bm_j, uint32_t* sa_j, uint32_t* nz_j,
+                               int32_t nnz_j, int8_t kind_j, int64_t sup_j,
+                               uint64_t* out_bm, uint32_t* out_sa, uint32_t* out_nz,
+                               int8_t* out_kind, int32_t* out_nnz,
+                               int n_words, int64_t min_sup, int64_t sa_thr,
+                               int64_t nb_tx, int64_t diff_thr) noexcept nogil:
+    """Dispatch sur les représentations, identique au cœur Numba"""
+    cdef int64_t cnt
+    cdef uint64_t* d
+    cdef uint64_t* o_bm
+    cdef uint32_t* o_sa
+    cdef int8_t o_kind
+    cdef int64_t o_sup
+
+    if kind_i == KIND_DIFF and kind_j == KIND_DIFF:
+        out_kind[0] = KIND_DIFF
+        out_nnz[0] = 0
+        cnt = isect_diff_diff(bm_i, bm_j, out_bm, n_words, nb_tx, min_sup)
+        if cnt < 0:
+            return -1
+        if cnt > diff_thr:
+            return cnt
+        # Le résultat n'est plus assez dense : re-matérialiser le bitmap
+        out_nnz[0] = diff_to_bm(out_bm, out_bm, out_nz, n_words, nb_tx)
+        if cnt < sa_thr:
+            bm_to_sa(out_bm, n_words, out_sa)
+            out_kind[0] = KIND_SA
+            out_nnz[0] = 0
+        else:
+            out_kind[0] = KIND_BITMAP
+        return cnt
+
+    if kind_i == KIND_DIFF or kind_j == KIND_DIFF:
+        if kind_i == KIND_DIFF:
+            d = bm_i
+            o_bm = bm_j; o_sa = sa_j; o_kind = kind_j; o_sup = sup_j
+        else:
+            d = bm_j
+            o_bm = bm_i; o_sa = sa_i; o_kind = kind_i; o_sup = sup_i
+        if o_kind == KIND_BITMAP:
+            cnt = isect_bm_diff(o_bm, d, out_bm, out_nz, out_nnz,
+                                n_words, min_sup)
+            if cnt >= 0 and cnt < sa_thr:
+                bm_to_sa(out_bm, n_words, out_sa)
+                out_kind[0] = KIND_SA
+                out_nnz[0] = 0
+            else:
+                out_kind[0] = KIND_BITMAP
+            return cnt
+        out_kind[0] = KIND_SA
+        out_nnz[0] = 0
+        return isect_sa_diff(o_sa, o_sup, d, out_sa, min_sup)
+
+    if kind_i == KIND_BITMAP and kind_j == KIND_BITMAP:
+        if nnz_i * SPARSE_WORDS_RATIO < nnz_j:
+            cnt = isect_bm_bm_sparse(bm_i, nz_i, nnz_i, bm_j, out_bm, out_nz,
+                                     out_nnz, n_words, min_sup)
+        elif nnz_j * SPARSE_WORDS_RATIO < nnz_i:
+            cnt = isect_bm_bm_sparse(bm_j, nz_j, nnz_j, bm_i, out_bm, out_nz,
+                                     out_nnz, n_words, min_sup)
+        else:
+            cnt = isect_bm_bm(bm_i, bm_j, out_bm, out_nz, out_nnz,
+                              n_words, min_sup)
+        if cnt >= 0 and cnt < sa_thr:
+            bm_to_sa(out_bm, n_words, out_sa)
+            out_kind[0] = KIND_SA
+        else:
+            out_kind[0] = KIND_BITMAP
+        return cnt
+
+    out_kind[0] = KIND_SA
+    out_nnz[0] = 0
+    if kind_i == KIND_BITMAP:
+        return isect_bm_sa(bm_i, sa_j, sup_j, out_sa, min_sup)
+    if kind_j == KIND_BITMAP:
+        return isect_bm_sa(bm_j, sa_i, sup_i, out_sa, min_sup)
+    if sup_i * GALLOP_RATIO < sup_j:
+        return isect_sa_gallop(sa_i, sup_i, sa_j, sup_j, out_sa, min_sup)
+    if sup_j * GALLOP_RATIO < sup_i:
+        return isect_sa_gallop(sa_j, sup_j, sa_i, sup_i, out_sa, min_sup)
+    return isect_sa_merge(sa_i, sup_i, sa_j, sup_j, out_sa, min_sup)
+
+
+cdef int64_t _subtree(int root,
+                      uint64_t[:, ::1] bm_items, uint32_t[:, ::1] sa_items,
+                      uint32_t[:, ::1] nz_items, int32_t[:] nnz_items,
+                      int8_t[:] kinds, int64_t[:] supports,
+                      int64_t[:, ::1] level2,
+                      int64_t min_sup, int64_t sa_thr,
+                      int64_t nb_tx, int64_t diff_thr) noexcept nogil:
+    """
+    Énumération itérative du sous-arbre de la racine `root` : pile
+    explicite par profondeur, buffers d'un niveau alloués au premier
+    passage et réutilisés, élagage des paires via level2
+    """
+    cdef int k = <int>kinds.shape[0]
+    cdef int n_words = <int>bm_items.shape[1]
+    cdef int sa_cap = <int>sa_items.shape[1]
+    cdef int nmax = k - root - 1
+    cdef int64_t total = 1
+    if nmax == 0:
+        return total
+
+    # Piles de buffers par profondeur (alloués à la demande)
+    cdef uint64_t** bm_st = <uint64_t**>malloc(nmax * sizeof(uint64_t*))
+    cdef uint32_t** sa_st = <uint32_t**>malloc(nmax * sizeof(uint32_t*))
+    cdef uint32_t** nz_st = <uint32_t**>malloc(nmax * sizeof(uint32_t*))
+    cdef int32_t** nnz_st = <int32_t**>malloc(nmax * sizeof(int32_t*))
+    cdef int8_t** kind_st = <int8_t**>malloc(nmax * sizeof(int8_t*))
+    cdef int64_t** sup_st = <int64_t**>malloc(nmax * sizeof(int64_t*))
+    cdef int32_t** id_st = <int32_t**>malloc(nmax * sizeof(int32_t*))
+    cdef int* m_st = <int*>malloc(nmax * sizeof(int))
+    cdef int* i_st = <int*>malloc(nmax * sizeof(int))
+    cdef int alloc_depth = 0
+    cdef int depth, i, j, m, cntm, id_i
+    cdef int64_t cnt
+    cdef int8_t okind
+    cdef int32_t onnz
+    cdef uint64_t* cb
+    cdef uint32_t* cs
+    cdef uint32_t* cz
+    cdef int32_t* cn
+    cdef int8_t* ck
+    cdef int64_t* cp
+    cdef int32_t* ci
+    cdef uint64_t* xb
+    cdef uint32_t* xs
+    cdef uint32_t* xz
+    cdef int32_t* xn
+    cdef int8_t* xk
+    cdef int64_t* xp
+    cdef int32_t* xi
+
+    for depth in range(nmax):
+        bm_st[depth] = NULL
+
+    # Niveau 0 : suffix de la racine
+    bm_st[0] = <uint64_t*>malloc(<size_t>nmax * n_words * sizeof(uint64_t))
+    sa_st[0] = <uint32_t*>malloc(<size_t>nmax * sa_cap * sizeof(uint32_t))
+    nz_st[0] = <uint32_t*>malloc(<size_t>nmax * n_words * sizeof(uint32_t))
+    nnz_st[0] = <int32_t*>malloc(nmax * sizeof(int32_t))
+    kind_st[0] = <int8_t*>malloc(nmax * sizeof(int8_t))
+    sup_st[0] = <int64_t*>malloc(nmax * sizeof(int64_t))
+    id_st[0] = <int32_t*>malloc(nmax * sizeof(int32_t))
+    alloc_depth = 1
+
+    cb = bm_st[0]
+    cs = sa_st[0]
+    cz = nz_st[0]
+    cn = nnz_st[0]
+    ck = kind_st[0]
+    cp = sup_st[0]
+    ci = id_st[0]
+    cntm = 0
+    for j in range(root + 1, k):
+        if level2[root, j] < min_sup:
+            continue
+        cnt = isect_into(
+            &bm_items[root, 0], &sa_items[root, 0], &nz_items[root, 0],
+            nnz_items[root], kinds[root], supports[root],
+            &bm_items[j, 0], &sa_items[j, 0], &nz_items[j, 0],
+            nnz_items[j], kinds[j], supports[j],
+            cb + <size_t>cntm * n_words, cs + <size_t>cntm * sa_cap,
+            cz + <size_t>cntm * n_words, &okind, &onnz,
+            n_words, min_sup, sa_thr, nb_tx, diff_thr
+        )
+        if cnt >= 0:
+            ck[cntm] = okind
+            cp[cntm] = cnt
+            cn[cntm] = onnz
+            ci[cntm] = <int32_t>j
+            cntm += 1
+
+    m_st[0] = cntm
+    i_st[0] = 0
+    depth = 0
+    if cntm == 0:
+        depth = -1
+
+    while depth >= 0:
+        i = i_st[depth]
+        m = m_st[depth]
+        if i >= m:
+            depth -= 1
+            continue
+        i_st[depth] = i + 1
+        total += 1
+        if i + 1 >= m:
+            continue
+
+        if depth + 1 >= alloc_depth:
+            bm_st[depth + 1] = <uint64_t*>malloc(<size_t>nmax * n_words * sizeof(uint64_t))
+            sa_st[depth + 1] = <uint32_t*>malloc(<size_t>nmax * sa_cap * sizeof(uint32_t))
+            nz_st[depth + 1] = <uint32_t*>malloc(<size_t>nmax * n_words * sizeof(uint32_t))
+            nnz_st[depth + 1] = <int32_t*>malloc(nmax * sizeof(int32_t))
+            kind_st[depth + 1] = <int8_t*>malloc(nmax * sizeof(int8_t))
+            sup_st[depth + 1] = <int64_t*>malloc(nmax * sizeof(int64_t))
+            id_st[depth + 1] = <int32_t*>malloc(nmax * sizeof(int32_t))
+            alloc_depth = depth + 2
+
+        cb = bm_st[depth]
+        cs = sa_st[depth]
+        cz = nz_st[depth]
+        cn = nnz_st[depth]
+        ck = kind_st[depth]
+        cp = sup_st[depth]
+        ci = id_st[depth]
+        xb = bm_st[depth + 1]
+        xs = sa_st[depth + 1]
+        xz = nz_st[depth + 1]
+        xn = nnz_st[depth + 1]
+        xk = kind_st[depth + 1]
+        xp = sup_st[depth + 1]
+        xi = id_st[depth + 1]
+
+        id_i = ci[i]
+        cntm = 0
+        for j in range(i + 1, m):
+            if level2[id_i, ci[j]] < min_sup:
+                continue
+            cnt = isect_into(
+                cb + <size_t>i * n_words, cs + <size_t>i * sa_cap,
+                cz + <size_t>i * n_words, cn[i], ck[i], cp[i],
+                cb + <size_t>j * n_words, cs + <size_t>j * sa_cap,
+                cz + <size_t>j * n_words, cn[j], ck[j], cp[j],
+                xb + <size_t>cntm * n_words, xs + <size_t>cntm * sa_cap,
+                xz + <size_t>cntm * n_words, &okind, &onnz,
+                n_words, min_sup, sa_thr, nb_tx, diff_thr
+            )
+            if cnt >= 0:
+                xk[cntm] = okind
+                xp[cntm] = cnt
+                xn[cntm] = onnz
+                xi[cntm] = ci[j]
+                cntm += 1
+
+        if cntm > 0:
+            m_st[depth + 1] = cntm
+            i_st[depth + 1] = 0
+            depth += 1
+
+    for depth in range(alloc_depth):
+        free(bm_st[depth])
+        free(sa_st[depth])
+        free(nz_st[depth])
+        free(nnz_st[depth])
+        free(kind_st[depth])
+        free(sup_st[depth])
+        free(id_st[depth])
+    free(bm_st)
+    free(sa_st)
+    free(nz_st)
+    free(nnz_st)
+    free(kind_st)
+    free(sup_st)
+    free(id_st)
+    free(m_st)
+    free(i_st)
+    return total
+
+
+def mine(uint64_t[:, ::1] bm_items, uint32_t[:, ::1] sa_items,
+         uint32_t[:, ::1] nz_items, int32_t[:] nnz_items,
+         int8_t[:] kinds, int64_t[:] supports, int64_t[:, ::1] level2,
+         int64_t min_support, int64_t sa_threshold,
+         int64_t nb_tx, int64_t diff_threshold):
+    """
+    Point d'entrée Python : même contrat que _eclat_parallel du cœur
+    Numba (compte chaque racine du niveau 1 plus son sous-arbre),
+    racines réparties sur les threads OpenMP
+    """
+    cdef int k = <int>kinds.shape[0]
+    cdef int64_t total = 0
+    cdef int root
+    for root in prange(k, nogil=True, schedule='dynamic'):
+        total += _subtree(root, bm_items, sa_items, nz_items, nnz_items,
+                          kinds, supports, level2, min_support, sa_threshold,
+                          nb_tx, diff_threshold)
+    return total
@@ -1,6 +1,7 @@
 # Implémentation de eclat trouvé sur geeksforgeeks
 # link : https://www.geeksforgeeks.org/machine-learning/ml-eclat-algorithm/
 
+from array import array
 from collections import defaultdict
 from itertools import combinations
 import math
@@ -20,28 +21,52 @@ transactions = {
 
 
 # Transformation de la base en db verticale
+# Les tidsets sont des array('i') triés plutôt que des sets : pas de
+# table de hachage (moitié moins de mémoire), et comme les TIDs sont
+# parcourus dans l'ordre les appends gardent le tableau trié sans re-tri
 
 def generate_tidsets(transactions):
-    item_tidset = defaultdict(set)
+    item_tidset = defaultdict(lambda: array('i'))
 
-    for tid, items in transactions.items():
+    for tid, (_, items) in enumerate(transactions.items()):
         for item in items:
-            item_tidset[item].add(tid)
+            item_tidset[item].append(tid)
     return item_tidset
 
 def generate_tidsets_from_dataset(filepath:str):
 
-    item_tidset = defaultdict(set)
+    item_tidset = defaultdict(lambda: array('i'))
 
     with open(filepath, 'r') as file:
         transactions = file.readlines()
         # Les items sont séparés par des spaces dans le fichier
         for tid, tset_line in enumerate(transactions):
             for item in tset_line.split(' '):
-                item_tidset[item].add(tid)
+                item_tidset[item].append(tid)
     return item_tidset
-        
-        
+
+
+def intersect_sorted(a, b):
+    # Intersection de deux tableaux triés par double curseur : chaque
+    # comparaison avance un curseur, pas de hachage et des branches
+    # prévisibles pour le processeur
+    out = array('i')
+    ia, ib = 0, 0
+    na, nb = len(a), len(b)
+    while ia < na and ib < nb:
+        va, vb = a[ia], b[ib]
+        if va == vb:
+            out.append(va)
+            ia += 1
+            ib += 1
+        elif va < vb:
+            ia += 1
+        else:
+            ib += 1
+    return out
+
+
+
 def get_dataset_length(filepath):
     l = 0
     with open(filepath, 'r') as file:
@@ -49,22 +74,30 @@ def get_dataset_length(filepath):
     return l
 
 
-def eclat(prefix, items, min_support, frequent_itemsets):
+def eclat(prefix, items, min_support):
+    # Générateur : chaque motif fréquent est produit sous forme
+    # (tuple, support) au fil du parcours — mémoire de travail en
+    # O(profondeur) au lieu d'un dict qui matérialise tous les motifs
     while items:
         item, tidset = items.pop()
         support = len(tidset)
 
         if support >= min_support:
             new_itemset = prefix + [item]
-            frequent_itemsets[frozenset(new_itemset)] = support
+            # L'énumération est déjà canonique (chaque itemset n'est
+            # produit qu'une fois) : un tuple suffit comme clé, se hache
+            # plus vite et occupe moins de mémoire qu'un frozenset
+            yield tuple(new_itemset), support
             suffix = []
 
             for other_item, other_tidset in items:
-                intersection = tidset & other_tidset
+                intersection = intersect_sorted(tidset, other_tidset)
                 if len(intersection) >= min_support:
                     suffix.append((other_item, intersection))
-            suffix = sorted(suffix, key=lambda x: len(x[1]))
-            eclat(new_itemset, suffix, min_support, frequent_itemsets)
+            # Pas de re-tri du suffix : le tri initial des items suffit,
+            # re-trier à chaque noeud coûtait O(m log m) par appel sans
+            # changer l'ensemble des itemsets trouvés
+            yield from eclat(new_itemset, suffix, min_support)
 
 
 # item_tidset = generate_tidsets_from_dataset("datasets/chess.dat")
@@ -85,8 +118,9 @@ items = sorted(item_tidset.items(), key=lambda x: len(x[1]))
 
 print(f" \nECLAT start with support at {min_support} \n")
 
-frequent_itemsets = {}
-eclat([], items, min_support, frequent_itemsets)
+# Le dict n'existe que pour l'affichage trié final ; un consommateur en
+# flux peut itérer le générateur directement sans rien matérialiser
+frequent_itemsets = dict(eclat([], items, min_support))
 
 print("Frequent itemsets (as list) -> support count")
 for itemset, support in sorted(frequent_itemsets.items(), key=lambda x: (-len(x[0]), -x[1], sorted(list(x[0])))):
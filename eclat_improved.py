@@ -1,112 +1,1045 @@
 """
 Implémentation optimisée de l'algorithme ECLAT
 Focus sur la performance et la consommation mémoire réduite
+
+Les tidsets sont représentés par des bitmaps (tableaux numpy de uint64)
+ou des tableaux triés de TIDs selon leur densité, et l'énumération
+récursive elle-même est compilée par Numba : les items sont des IDs
+entiers, plus aucun objet Python dans la boucle chaude.
 """
 
 from collections import defaultdict
-from typing import Dict, Set, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+import mmap
+import os
 import time
 import argparse
 import sys
 import gc
 
+import numpy as np
+import numba
+
+# Cœur C optionnel (python setup.py build_ext --inplace) : même
+# algorithme compilé par Cython, sans démarrage JIT. ECLAT_NO_CEXT=1
+# force le cœur Numba.
+try:
+    if os.environ.get("ECLAT_NO_CEXT"):
+        raise ImportError
+    import _eclat as _eclat_c
+    _HAS_CEXT = True
+except ImportError:
+    _eclat_c = None
+    _HAS_CEXT = False
+
+# Offload GPU optionnel du niveau 2 (numba.cuda est absent de
+# certaines installations numba récentes : repli CPU dans ce cas)
+try:
+    from numba import cuda
+    _HAS_CUDA = cuda.is_available()
+except Exception:
+    cuda = None
+    _HAS_CUDA = False
+
+# Représentations d'un tidset (sélection de variante à la SISA) :
+# - KIND_BITMAP : bitmap uint64, 1 bit par transaction (datasets denses)
+# - KIND_SA     : tableau trié uint32 de TIDs (datasets creux type retail)
+# - KIND_DIFF   : bitmap du complément (diffset, dEclat) quand le tidset
+#                 couvre plus de 90% des transactions — le travail se
+#                 fait alors sur la représentation la plus petite
+# Un tidset bascule en SA dès que support < nb_transactions / 32,
+# soit le point où le parcours O(|A|+|B|) bat le AND sur N/64 mots
+KIND_BITMAP = 0
+KIND_SA = 1
+KIND_DIFF = 2
+
+# Bascule en diffset au-delà de 90% de couverture
+DIFF_RATIO = 0.9
+
+# Gallop plutôt que merge quand |A| * 32 < |B|
+GALLOP_RATIO = 32
+
+# Parcours des seuls mots non nuls du bitmap le plus creux quand son
+# nombre de mots non nuls est 32x plus petit que celui de l'autre
+SPARSE_WORDS_RATIO = 32
+
+# Lignes de bitmap arrondies à 8 mots uint64 (64 octets = une ligne de
+# cache) : AND/popcount vectorisés pleine largeur, sans queue scalaire
+WORDS_ALIGN = 8
+
+
+def _aligned_zeros(n_rows: int, n_words: int) -> np.ndarray:
+    """
+    Matrice uint64 (n_rows, n_words) remplie de zéros dont la première
+    ligne tombe sur une frontière de 64 octets. numpy ne garantit que
+    l'alignement de base de l'allocateur ; on sur-alloue de 8 mots et on
+    décale la vue jusqu'à l'adresse alignée (la vue garde une référence
+    sur le tampon sous-jacent).
+    """
+    raw = np.zeros(n_rows * n_words + WORDS_ALIGN, dtype=np.uint64)
+    offset = (-raw.ctypes.data % 64) // 8
+    return raw[offset:offset + n_rows * n_words].reshape(n_rows, n_words)
+
+
+@numba.njit(cache=True, inline='always')
+def _popcnt_word(x):
+    """
+    Popcount SWAR d'un mot uint64 (constantes de Hamming classiques)
+    """
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return np.int64((x * np.uint64(0x0101010101010101)) >> np.uint64(56))
+
+
+@numba.njit(cache=True)
+def popcnt_u64(a):
+    """
+    Popcount SWAR sur un tableau uint64 (somme des bits à 1)
+    Un POPCNT par mot de 8 octets, sans déballage des bits
+    """
+    s = 0
+    for x in a:
+        s += _popcnt_word(x)
+    return s
+
+
+def popcount(bitmap: np.ndarray) -> int:
+    """
+    Nombre de bits à 1 dans un bitmap uint64 (= support du tidset)
+    """
+    return int(popcnt_u64(bitmap))
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_bm_bm_sparse(a, a_nz, a_nnz, b, out, out_nz, min_support):
+    """
+    Kernel bitmap ∩ bitmap asymétrique : n'itère que les mots non nuls
+    de a (table a_nz) et saute directement dans b par indice — les
+    bitmaps étant alignés mot à mot, le « galop » se réduit à un accès
+    direct. out est d'abord remis à zéro (écritures séquentielles, sans
+    lecture de b) pour rester un bitmap complet, puis seuls les mots
+    utiles de b sont chargés : O(nnz(a)) lectures au lieu de O(n/64).
+
+    Returns:
+        (support, nb de mots non nuls) ; support = -1 si < min_support
+    """
+    out[:] = np.uint64(0)
+    cnt = 0
+    nnz = 0
+    for t in range(a_nnz):
+        k = np.int64(a_nz[t])
+        w = a[k] & b[k]
+        if w != np.uint64(0):
+            out[k] = w
+            out_nz[nnz] = a_nz[t]
+            nnz += 1
+            cnt += _popcnt_word(w)
+        if cnt + (a_nnz - t - 1) * 64 < min_support:
+            return -1, nnz
+    if cnt < min_support:
+        return -1, nnz
+    return cnt, nnz
+
+
+@numba.njit(cache=True, boundscheck=False)
+def bm_to_sa(bm, out):
+    """
+    Convertit un bitmap en tableau trié de TIDs (uint32)
+    Extraction bit à bit par w &= w - 1 : coût proportionnel au support
+
+    Returns:
+        Nombre de TIDs écrits dans out
+    """
+    n = 0
+    for k in range(bm.shape[0]):
+        w = bm[k]
+        base = k * 64
+        while w != np.uint64(0):
+            low = w & (~w + np.uint64(1))
+            out[n] = np.uint32(base + _popcnt_word(low - np.uint64(1)))
+            n += 1
+            w &= w - np.uint64(1)
+    return n
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_bm_sa(bm, sa, out, min_support):
+    """
+    Kernel bitmap ∩ SA : teste le bit de chaque TID du tableau trié,
+    écrit les TIDs retenus dans out (toujours un SA en sortie)
+
+    Returns:
+        Le support de l'intersection, ou -1 si < min_support
+    """
+    na = sa.shape[0]
+    cnt = 0
+    for i in range(na):
+        t = np.int64(sa[i])
+        if (bm[t >> 6] >> np.uint64(t & 63)) & np.uint64(1):
+            out[cnt] = sa[i]
+            cnt += 1
+        if cnt + (na - i - 1) < min_support:
+            return -1
+    if cnt < min_support:
+        return -1
+    return cnt
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_sa_sa_merge(a, b, out, min_support):
+    """
+    Kernel SA ∩ SA par fusion à deux pointeurs (tailles comparables)
+
+    Returns:
+        Le support de l'intersection, ou -1 si < min_support
+    """
+    na = a.shape[0]
+    nb = b.shape[0]
+    ia = 0
+    ib = 0
+    cnt = 0
+    while ia < na and ib < nb:
+        va = a[ia]
+        vb = b[ib]
+        if va == vb:
+            out[cnt] = va
+            cnt += 1
+            ia += 1
+            ib += 1
+        elif va < vb:
+            ia += 1
+        else:
+            ib += 1
+        if cnt + min(na - ia, nb - ib) < min_support:
+            return -1
+    if cnt < min_support:
+        return -1
+    return cnt
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_sa_sa_gallop(a, b, out, min_support):
+    """
+    Kernel SA ∩ SA par galop : itère le petit tableau a, saute dans le
+    grand tableau b par pas exponentiels puis recherche binaire.
+    O(|A| log(|B|/|A|)) accès au lieu de O(|A|+|B|)
+
+    Returns:
+        Le support de l'intersection, ou -1 si < min_support
+    """
+    na = a.shape[0]
+    nb = b.shape[0]
+    cnt = 0
+    j = 0
+    for ia in range(na):
+        t = a[ia]
+        # Galop : doubler le pas tant que b[j+pas] < t
+        if j < nb and b[j] < t:
+            step = 1
+            while j + step < nb and b[j + step] < t:
+                step <<= 1
+            # Recherche binaire du premier b[m] >= t dans (j, j+pas]
+            lo = j + (step >> 1)
+            hi = min(j + step, nb)
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                if b[mid] < t:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            j = lo
+        if j >= nb:
+            break
+        if b[j] == t:
+            out[cnt] = t
+            cnt += 1
+            j += 1
+        if cnt + (na - ia - 1) < min_support:
+            return -1
+    if cnt < min_support:
+        return -1
+    return cnt
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_diff_diff(a, b, out, nb_tx, min_support):
+    """
+    Kernel diffset ∩ diffset : l'intersection des tidsets est l'union
+    des compléments, support = nb_tx - popcount(a | b). Sortie anticipée
+    dès que le support résiduel passe sous min_support.
+
+    Returns:
+        Le support de l'intersection, ou -1 si < min_support
+    """
+    n = a.shape[0]
+    cnt = 0
+    for k in range(n):
+        w = a[k] | b[k]
+        out[k] = w
+        cnt += _popcnt_word(w)
+        if nb_tx - cnt < min_support:
+            return -1
+    return nb_tx - cnt
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_bm_diff(a, d, out, out_nz, min_support):
+    """
+    Kernel bitmap ∩ diffset : AND-NOT fusionné (a & ~d), même structure
+    que le kernel bitmap ∩ bitmap (popcount au fil de l'eau, table des
+    mots non nuls, sortie anticipée)
+
+    Returns:
+        (support, nb de mots non nuls) ; support = -1 si < min_support
+    """
+    n = a.shape[0]
+    cnt = 0
+    nnz = 0
+    for k in range(n):
+        w = a[k] & ~d[k]
+        out[k] = w
+        if w != np.uint64(0):
+            out_nz[nnz] = np.uint32(k)
+            nnz += 1
+            cnt += _popcnt_word(w)
+        if cnt + (n - k - 1) * 64 < min_support:
+            return -1, nnz
+    if cnt < min_support:
+        return -1, nnz
+    return cnt, nnz
+
+
+@numba.njit(cache=True, boundscheck=False)
+def intersect_sa_diff(sa, d, out, min_support):
+    """
+    Kernel SA ∩ diffset : garde les TIDs dont le bit est absent du
+    complément
+
+    Returns:
+        Le support de l'intersection, ou -1 si < min_support
+    """
+    na = sa.shape[0]
+    cnt = 0
+    for i in range(na):
+        t = np.int64(sa[i])
+        if not ((d[t >> 6] >> np.uint64(t & 63)) & np.uint64(1)):
+            out[cnt] = sa[i]
+            cnt += 1
+        if cnt + (na - i - 1) < min_support:
+            return -1
+    if cnt < min_support:
+        return -1
+    return cnt
+
+
+@numba.njit(cache=True, boundscheck=False)
+def diff_to_bm(d, out, out_nz, nb_tx):
+    """
+    Re-matérialise le bitmap direct depuis un diffset (complément masqué
+    des bits de bourrage du dernier mot) et relève ses mots non nuls
+
+    Returns:
+        Nombre de mots non nuls du bitmap
+    """
+    n = d.shape[0]
+    nnz = 0
+    tail = nb_tx & 63
+    last = (nb_tx - 1) >> 6
+    for k in range(n):
+        if k > last:
+            # Mots de bourrage (lignes arrondies à la ligne de cache)
+            out[k] = np.uint64(0)
+            continue
+        w = ~d[k]
+        if k == last and tail != 0:
+            w &= (np.uint64(1) << np.uint64(tail)) - np.uint64(1)
+        out[k] = w
+        if w != np.uint64(0):
+            out_nz[nnz] = np.uint32(k)
+            nnz += 1
+    return nnz
+
+
+@numba.njit(cache=True)
+def _scan_dataset(buf):
+    """
+    Première passe sur les octets du fichier : compte les transactions
+    et les tokens, relève l'item maximum et vérifie que tous les items
+    sont des entiers ASCII (cas des datasets FIMI : chess, retail, ...)
+
+    Returns:
+        (ok, nb_transactions, item_max, nb_tokens) ; ok=False si un
+        octet n'est ni chiffre ni séparateur (le parseur Python prend
+        le relais)
+    """
+    n = buf.shape[0]
+    nb_tx = 0
+    nb_tokens = 0
+    max_item = -1
+    val = -1
+    for p in range(n):
+        c = buf[p]
+        if 48 <= c <= 57:  # '0'-'9'
+            val = (0 if val < 0 else val) * 10 + (c - 48)
+        elif c == 10 or c == 32 or c == 13 or c == 9:  # \n, espace, \r, \t
+            if val > max_item:
+                max_item = val
+            if val >= 0:
+                nb_tokens += 1
+            val = -1
+            if c == 10:
+                nb_tx += 1
+        else:
+            return False, 0, -1, 0
+    # Dernière ligne sans \n final
+    if val > max_item:
+        max_item = val
+    if val >= 0:
+        nb_tokens += 1
+    if n > 0 and buf[n - 1] != 10:
+        nb_tx += 1
+    return True, nb_tx, max_item, nb_tokens
+
+
+@numba.njit(cache=True, boundscheck=False)
+def _parse_csr(buf, indptr, indices):
+    """
+    Seconde passe : parse les entiers ASCII en place et construit la
+    base en format CSR transaction-major — indptr[t]..indptr[t+1]
+    délimite les items de la transaction t dans indices. Tableaux
+    numpy contigus, aucune chaîne Python ni dict par token, prêts
+    pour un kernel Numba ou une copie device.
+    """
+    tid = 0
+    pos = 0
+    val = -1
+    for p in range(buf.shape[0]):
+        c = buf[p]
+        if 48 <= c <= 57:
+            val = (0 if val < 0 else val) * 10 + (c - 48)
+        else:
+            if val >= 0:
+                indices[pos] = val
+                pos += 1
+                val = -1
+            if c == 10:
+                tid += 1
+                indptr[tid] = pos
+    if val >= 0:
+        indices[pos] = val
+        pos += 1
+    # Dernière ligne sans \n final : fermer la dernière transaction
+    indptr[indptr.shape[0] - 1] = pos
+
+
+@numba.njit(cache=True, boundscheck=False)
+def _bitmaps_from_csr(indptr, indices, bits, counts):
+    """
+    Empaquetage CSR -> bitmaps : pour chaque transaction, pose le bit
+    tid sur la ligne de chacun de ses items et accumule les supports
+    """
+    for tid in range(indptr.shape[0] - 1):
+        w = tid >> 6
+        m = np.uint64(1) << np.uint64(tid & 63)
+        for p in range(indptr[tid], indptr[tid + 1]):
+            it = indices[p]
+            bits[it, w] |= m
+            counts[it] += 1
+
+
+if _HAS_CUDA:
+    @cuda.jit
+    def _level2_pairs_kernel(B, out):
+        """
+        Kernel CUDA niveau 2 : un thread par paire (i, j), AND +
+        __popcll (cuda.popc) sur les mots du bitmap. Toutes les paires
+        sont indépendantes avec un flot de contrôle identique — le cas
+        idéal GPU.
+        """
+        i, j = cuda.grid(2)
+        k = B.shape[0]
+        if i < k and i < j < k:
+            c = 0
+            for w in range(B.shape[1]):
+                c += cuda.popc(B[i, w] & B[j, w])
+            out[i, j] = c
+
+
+def level2_supports_gpu(bm_items: np.ndarray) -> np.ndarray:
+    """
+    Supports de tous les 2-itemsets calculés sur GPU : la matrice
+    bitmap est copiée une fois sur le device, un thread par paire,
+    seule la matrice (k, k) des supports revient sur l'hôte.
+
+    Args:
+        bm_items: Matrice bitmap (k, n_words) des 1-itemsets fréquents
+
+    Returns:
+        Matrice (k, k) des supports, remplie pour j > i
+    """
+    k = bm_items.shape[0]
+    d_bits = cuda.to_device(bm_items)
+    d_out = cuda.device_array((k, k), dtype=np.int64)
+    tpb = 16
+    blocks = ((k + tpb - 1) // tpb, (k + tpb - 1) // tpb)
+    _level2_pairs_kernel[blocks, (tpb, tpb)](d_bits, d_out)
+    return d_out.copy_to_host()
+
+
+def level2_supports(bm_items: np.ndarray, l2_budget: int = 1 << 21) -> np.ndarray:
+    """
+    Supports de tous les 2-itemsets par AND + popcount broadcastés,
+    calculés par tuiles (TS, TS) de bitmaps : chaque tuile est
+    streamée une fois puis réutilisée pour TS paires, comme un produit
+    matriciel booléen par blocs dimensionné pour tenir en cache L2.
+    Version CPU ; sur machine avec GPU, level2_supports_gpu fait le
+    même calcul en un kernel CUDA.
+
+    Args:
+        bm_items: Matrice bitmap (k, n_words) des 1-itemsets fréquents
+        l2_budget: Octets de cache visés par paire de tuiles
+
+    Returns:
+        Matrice (k, k) des supports, remplie pour j > i
+    """
+    k, n_words = bm_items.shape
+    # TS² * n_words * 8 octets par tuile d'intersections
+    ts = max(8, min(64, int((l2_budget // (max(n_words, 1) * 8)) ** 0.5)))
+    out = np.zeros((k, k), dtype=np.int64)
+    for ti in range(0, k, ts):
+        bi = bm_items[ti:ti + ts]
+        for tj in range(ti, k, ts):
+            bj = bm_items[tj:tj + ts]
+            inter = bi[:, None, :] & bj[None, :, :]
+            out[ti:ti + ts, tj:tj + ts] = np.bitwise_count(inter).sum(axis=2, dtype=np.int64)
+    return out
+
+
+_CORE_CACHE: dict = {}
+
+
+def _make_core(n_words: int):
+    """
+    Fabrique le cœur Numba spécialisé pour une largeur de ligne donnée :
+    n_words est capturé par fermeture et devient une constante de
+    compilation dans le kernel AND+popcount, que LLVM peut dérouler
+    entièrement (chess : 56 mots, la boucle disparaît). Le kernel étant
+    appelé depuis du code jité, toute la chaîne de dispatch est
+    recompilée avec lui ; cache=True ne fonctionnant pas avec les
+    fermetures, les cœurs compilés sont mémorisés par largeur dans
+    _CORE_CACHE (une compilation par dataset de géométrie nouvelle).
+    """
+
+    @numba.njit(boundscheck=False)
+    def intersect_and_count_ge(a, b, out, out_nz, min_support):
+        """
+        Kernel fusionné bitmap ∩ bitmap : AND mot à mot de a et b écrit dans
+        out, popcount accumulé au fil de l'eau. Un seul passage mémoire au
+        lieu de AND puis popcount (deux passages + un tableau temporaire).
+        Les indices des mots non nuls du résultat sont relevés dans out_nz
+        (table de saut pour les intersections asymétriques suivantes).
+
+        Sortie anticipée : dès que popcount_partiel + 64 * mots_restants
+        ne peut plus atteindre min_support, le candidat est abandonné.
+
+        Returns:
+            (support, nb de mots non nuls) ; support = -1 si < min_support
+        """
+        cnt = 0
+        nnz = 0
+        for k in range(n_words):
+            w = a[k] & b[k]
+            out[k] = w
+            if w != np.uint64(0):
+                out_nz[nnz] = np.uint32(k)
+                nnz += 1
+                cnt += _popcnt_word(w)
+            if cnt + (n_words - k - 1) * 64 < min_support:
+                return -1, nnz
+        if cnt < min_support:
+            return -1, nnz
+        return cnt, nnz
+
+    @numba.njit(boundscheck=False)
+    def _intersect_into(bm_i, sa_i, nz_i, nnz_i, kind_i, sup_i,
+                        bm_j, sa_j, nz_j, nnz_j, kind_j, sup_j,
+                        out_bm, out_sa, out_nz, min_support, sa_threshold,
+                        nb_tx, diff_threshold):
+        """
+        Intersection avec dispatch sur les représentations des deux tidsets ;
+        écrit le résultat dans le slot bitmap ou SA fourni (et sa table de
+        mots non nuls pour un bitmap). Un diffset occupe le slot bitmap de
+        son item ; l'invariant est que chaque résultat repart dans la
+        représentation la moins chère pour son support.
+
+        Returns:
+            (support, kind, nnz) du résultat ; support = -1 si < min_support
+        """
+        if kind_i == KIND_DIFF and kind_j == KIND_DIFF:
+            cnt = intersect_diff_diff(bm_i, bm_j, out_bm, nb_tx, min_support)
+            if cnt < 0:
+                return -1, KIND_DIFF, 0
+            if cnt > diff_threshold:
+                return cnt, KIND_DIFF, 0
+            # Le résultat n'est plus assez dense : re-matérialiser le bitmap
+            nnz = diff_to_bm(out_bm, out_bm, out_nz, nb_tx)
+            if cnt < sa_threshold:
+                bm_to_sa(out_bm, out_sa)
+                return cnt, KIND_SA, 0
+            return cnt, KIND_BITMAP, nnz
+
+        if kind_i == KIND_DIFF or kind_j == KIND_DIFF:
+            if kind_i == KIND_DIFF:
+                d = bm_i
+                o_bm, o_sa, o_kind, o_sup = bm_j, sa_j, kind_j, sup_j
+            else:
+                d = bm_j
+                o_bm, o_sa, o_kind, o_sup = bm_i, sa_i, kind_i, sup_i
+            if o_kind == KIND_BITMAP:
+                cnt, nnz = intersect_bm_diff(o_bm, d, out_bm, out_nz, min_support)
+                if cnt >= 0 and cnt < sa_threshold:
+                    bm_to_sa(out_bm, out_sa)
+                    return cnt, KIND_SA, 0
+                return cnt, KIND_BITMAP, nnz
+            return intersect_sa_diff(o_sa[:o_sup], d, out_sa, min_support), KIND_SA, 0
+
+        if kind_i == KIND_BITMAP and kind_j == KIND_BITMAP:
+            # Bitmaps très asymétriques : sauter les mots nuls du plus creux
+            if nnz_i * SPARSE_WORDS_RATIO < nnz_j:
+                cnt, nnz = intersect_bm_bm_sparse(bm_i, nz_i, nnz_i, bm_j,
+                                                  out_bm, out_nz, min_support)
+            elif nnz_j * SPARSE_WORDS_RATIO < nnz_i:
+                cnt, nnz = intersect_bm_bm_sparse(bm_j, nz_j, nnz_j, bm_i,
+                                                  out_bm, out_nz, min_support)
+            else:
+                cnt, nnz = intersect_and_count_ge(bm_i, bm_j, out_bm, out_nz,
+                                                  min_support)
+            # Conversion paresseuse : le résultat est devenu creux
+            if cnt >= 0 and cnt < sa_threshold:
+                bm_to_sa(out_bm, out_sa)
+                return cnt, KIND_SA, 0
+            return cnt, KIND_BITMAP, nnz
+
+        if kind_i == KIND_BITMAP:
+            return intersect_bm_sa(bm_i, sa_j[:sup_j], out_sa, min_support), KIND_SA, 0
+        if kind_j == KIND_BITMAP:
+            return intersect_bm_sa(bm_j, sa_i[:sup_i], out_sa, min_support), KIND_SA, 0
+
+        a = sa_i[:sup_i]
+        b = sa_j[:sup_j]
+        if sup_i * GALLOP_RATIO < sup_j:
+            return intersect_sa_sa_gallop(a, b, out_sa, min_support), KIND_SA, 0
+        if sup_j * GALLOP_RATIO < sup_i:
+            return intersect_sa_sa_gallop(b, a, out_sa, min_support), KIND_SA, 0
+        return intersect_sa_sa_merge(a, b, out_sa, min_support), KIND_SA, 0
+
+    @numba.njit
+    def _eclat_iter(bm_items, sa_items, nz_items, nnz_items, kinds, supports,
+                    ids, level2, min_support, sa_threshold, nb_tx, diff_threshold):
+        """
+        Cœur itératif ECLAT compilé : le parcours en profondeur est déroulé
+        sur une pile explicite (un curseur d'item par profondeur) au lieu
+        d'appels récursifs — pas de frame par nœud, pas de limite de
+        récursion, et les buffers d'une profondeur sont alloués une seule
+        fois puis réutilisés pour tous les sous-arbres qui y repassent.
+        Chaque item reçu est déjà fréquent ; la fonction compte les
+        itemsets énumérés.
+
+        Borne de branche : sup(P ∪ {a, b}) <= sup({a, b}), déjà dans la
+        matrice level2. L'indice niveau-1 de chaque item est donc propagé
+        à toutes les profondeurs et la paire est écartée sans intersection
+        dès que level2 la condamne.
+
+        Args:
+            bm_items: Bitmaps (m, n_words) des tidsets (lignes kind=BITMAP)
+            sa_items: TIDs triés (m, sa_cap), longueurs dans supports (kind=SA)
+            nz_items: Indices des mots non nuls de chaque bitmap (m, n_words)
+            nnz_items: Nombre de mots non nuls de chaque bitmap (int32)
+            kinds: Représentation de chaque tidset (int8)
+            supports: Support de chaque item (int64)
+            ids: Indice niveau-1 de chaque item (int32)
+            level2: Matrice (k, k) des supports des paires (j > i)
+            min_support: Support minimum absolu
+            sa_threshold: Seuil de densité de bascule bitmap -> SA
+
+        Returns:
+            Nombre d'itemsets fréquents énumérés
+        """
+        m0 = kinds.shape[0]
+        n_words = bm_items.shape[1]
+        sa_cap = sa_items.shape[1]
+        max_items = max(m0 - 1, 1)
+        total = 0
+
+        # Piles indexées par profondeur : items du niveau + curseur courant
+        bm_stack = [bm_items]
+        sa_stack = [sa_items]
+        nz_stack = [nz_items]
+        nnz_stack = [nnz_items]
+        kind_stack = [kinds]
+        sup_stack = [supports]
+        id_stack = [ids]
+        m_stack = [m0]
+        i_stack = [0]
+
+        depth = 0
+        while depth >= 0:
+            i = i_stack[depth]
+            m = m_stack[depth]
+            if i >= m:
+                # Niveau épuisé : remonter
+                depth -= 1
+                continue
+            i_stack[depth] = i + 1
+            total += 1
+
+            if i + 1 >= m:
+                continue
+
+            # Buffers du niveau suivant (pool par profondeur, alloué une fois)
+            if depth + 1 >= len(bm_stack):
+                bm_stack.append(np.empty((max_items, n_words), dtype=np.uint64))
+                sa_stack.append(np.empty((max_items, sa_cap), dtype=np.uint32))
+                nz_stack.append(np.empty((max_items, n_words), dtype=np.uint32))
+                nnz_stack.append(np.empty(max_items, dtype=np.int32))
+                kind_stack.append(np.empty(max_items, dtype=np.int8))
+                sup_stack.append(np.empty(max_items, dtype=np.int64))
+                id_stack.append(np.empty(max_items, dtype=np.int32))
+                m_stack.append(0)
+                i_stack.append(0)
+
+            cur_bm = bm_stack[depth]
+            cur_sa = sa_stack[depth]
+            cur_nz = nz_stack[depth]
+            cur_nnz = nnz_stack[depth]
+            cur_kind = kind_stack[depth]
+            cur_sup = sup_stack[depth]
+            cur_ids = id_stack[depth]
+            nxt_bm = bm_stack[depth + 1]
+            nxt_sa = sa_stack[depth + 1]
+            nxt_nz = nz_stack[depth + 1]
+            nxt_nnz = nnz_stack[depth + 1]
+            nxt_kind = kind_stack[depth + 1]
+            nxt_sup = sup_stack[depth + 1]
+            nxt_ids = id_stack[depth + 1]
+
+            # Construire le suffix : intersections de l'item i avec i+1..m
+            id_i = cur_ids[i]
+            cntm = 0
+            for j in range(i + 1, m):
+                # Élagage par borne : l'ordre du niveau 1 est préservé dans
+                # les suffixes, donc id_i < cur_ids[j] et le support de la
+                # paire sous-jacente majore celui du candidat
+                if level2[id_i, cur_ids[j]] < min_support:
+                    continue
+                cnt, kind, nnz = _intersect_into(
+                    cur_bm[i], cur_sa[i], cur_nz[i], cur_nnz[i], cur_kind[i], cur_sup[i],
+                    cur_bm[j], cur_sa[j], cur_nz[j], cur_nnz[j], cur_kind[j], cur_sup[j],
+                    nxt_bm[cntm], nxt_sa[cntm], nxt_nz[cntm], min_support,
+                    sa_threshold, nb_tx, diff_threshold
+                )
+                if cnt >= 0:
+                    nxt_kind[cntm] = kind
+                    nxt_sup[cntm] = cnt
+                    nxt_nnz[cntm] = nnz
+                    nxt_ids[cntm] = cur_ids[j]
+                    cntm += 1
+
+            if cntm > 0:
+                # Descendre dans le sous-arbre
+                m_stack[depth + 1] = cntm
+                i_stack[depth + 1] = 0
+                depth += 1
+
+        return total
+
+
+    @numba.njit
+    def _eclat_subtree(root, bm_items, sa_items, nz_items, nnz_items, kinds,
+                       supports, level2, min_support, sa_threshold,
+                       nb_tx, diff_threshold):
+        """
+        Énumère le sous-arbre enraciné sur l'item `root` du niveau 1 :
+        construit son suffix (en écartant les paires infréquentes via la
+        matrice level2) puis déroule le parcours itératif. Chaque racine
+        est indépendante — c'est l'unité de travail de la parallélisation.
+
+        Returns:
+            Nombre d'itemsets fréquents du sous-arbre (racine comprise)
+        """
+        m0 = kinds.shape[0]
+        n_words = bm_items.shape[1]
+        sa_cap = sa_items.shape[1]
+        total = 1
+        nmax = m0 - root - 1
+        if nmax == 0:
+            return total
+
+        s_bm = np.empty((nmax, n_words), dtype=np.uint64)
+        s_sa = np.empty((nmax, sa_cap), dtype=np.uint32)
+        s_nz = np.empty((nmax, n_words), dtype=np.uint32)
+        s_nnz = np.empty(nmax, dtype=np.int32)
+        s_kinds = np.empty(nmax, dtype=np.int8)
+        s_supports = np.empty(nmax, dtype=np.int64)
+        s_ids = np.empty(nmax, dtype=np.int32)
+        cntm = 0
+        for j in range(root + 1, m0):
+            # Support de la paire déjà connu via la passe par tuiles :
+            # inutile d'intersecter les paires perdantes
+            if level2[root, j] < min_support:
+                continue
+            cnt, kind, nnz = _intersect_into(
+                bm_items[root], sa_items[root], nz_items[root], nnz_items[root],
+                kinds[root], supports[root],
+                bm_items[j], sa_items[j], nz_items[j], nnz_items[j],
+                kinds[j], supports[j],
+                s_bm[cntm], s_sa[cntm], s_nz[cntm], min_support, sa_threshold,
+                nb_tx, diff_threshold
+            )
+            if cnt >= 0:
+                s_kinds[cntm] = kind
+                s_supports[cntm] = cnt
+                s_nnz[cntm] = nnz
+                s_ids[cntm] = j
+                cntm += 1
+
+        if cntm > 0:
+            total += _eclat_iter(
+                s_bm[:cntm], s_sa[:cntm], s_nz[:cntm], s_nnz[:cntm],
+                s_kinds[:cntm], s_supports[:cntm],
+                s_ids[:cntm], level2, min_support, sa_threshold,
+                nb_tx, diff_threshold
+            )
+        return total
+
+
+    @numba.njit(parallel=True)
+    def _eclat_parallel(bm_items, sa_items, nz_items, nnz_items, kinds,
+                        supports, level2, min_support, sa_threshold,
+                        nb_tx, diff_threshold):
+        """
+        Répartit les sous-arbres du niveau 1 sur les cœurs CPU : chaque
+        itération de prange explore une racine avec ses propres buffers
+        (lecture seule sur les tableaux partagés), les compteurs locaux
+        sont réduits en une somme
+        """
+        m0 = kinds.shape[0]
+        total = 0
+        for root in numba.prange(m0):
+            total += _eclat_subtree(
+                root, bm_items, sa_items, nz_items, nnz_items, kinds,
+                supports, level2, min_support, sa_threshold,
+                nb_tx, diff_threshold
+            )
+        return total
+
+    return _eclat_parallel
+
+
+def _get_core(n_words: int):
+    """
+    Cœur spécialisé pour n_words mots par bitmap (compilé à la
+    première demande, puis réutilisé)
+    """
+    core = _CORE_CACHE.get(n_words)
+    if core is None:
+        core = _make_core(n_words)
+        _CORE_CACHE[n_words] = core
+    return core
+
+
 class ECLATMiner:
-    def __init__(self, min_support: float = 0.2, verbose: bool = True):
+    def __init__(self, min_support: float = 0.2, verbose: bool = True,
+                 on_itemset: Optional[Callable[[Tuple[str, ...], int], None]] = None):
         """
         Initialise le mineur ECLAT
-        
+
         Args:
             min_support: Support minimum (en pourcentage, ex: 0.2 pour 20%)
             verbose: Afficher les informations de progression
+            on_itemset: Callback appelé pour chaque itemset fréquent avec
+                (itemset, support) — émission en flux, aucun motif n'est
+                matérialisé en mémoire. None (défaut) = comptage pur via
+                les cœurs compilés, beaucoup plus rapide.
         """
         self.min_support_ratio = min_support
+        self.on_itemset = on_itemset
         self.min_support_count = 0
         self.nb_transactions = 0
         self.nb_frequent_itemsets = 0
+        self.n_words = 0
         self.verbose = verbose
-        
-    def load_dataset(self, filepath: str) -> Dict[str, Set[int]]:
+        self._sa_threshold = 0
+        self._diff_threshold = 0
+        self._nb_distinct = 0
+        # Correspondance item (chaîne) <-> ID entier
+        self.item_to_id: Dict[str, int] = {}
+        self.id_to_item: List[str] = []
+
+    def load_dataset(self, filepath: str) -> np.ndarray:
         """
         Charge un dataset et génère les tidsets (format vertical)
-        Optimisé pour réduire la consommation mémoire
-        
+        sous forme de bitmaps uint64 : une ligne par item, un bit par
+        transaction. Les items (chaînes) sont encodés en IDs entiers.
+
+        Le fichier est mmapé et parsé octet par octet par un kernel
+        Numba quand les items sont des entiers ASCII (datasets FIMI) :
+        les bits sont posés directement pendant le parsing, sans
+        allocation de chaînes ni dict par token. Sinon, repli sur le
+        tokenizer Python générique.
+
         Args:
             filepath: Chemin vers le fichier dataset
-            
+
         Returns:
-            Dictionnaire {item -> set de transaction IDs}
+            Matrice bitmap (nb_items, n_words) ; l'ID d'un item est
+            l'indice de sa ligne (voir id_to_item / item_to_id)
         """
-        item_tidset = defaultdict(set)
-        
         try:
-            with open(filepath, 'r') as file:
-                for tid, line in enumerate(file):
-                    items = line.strip().split()
-                    for item in items:
-                        if item:
-                            item_tidset[item].add(tid)
-            
-            self.nb_transactions = tid + 1
-            self.min_support_count = int(self.nb_transactions * self.min_support_ratio)
-            
+            bits = None
+            with open(filepath, 'rb') as file:
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    buf = np.frombuffer(mm, dtype=np.uint8)
+                    ok, nb_tx, max_item, nb_tokens = _scan_dataset(buf)
+                    if ok and max_item >= 0:
+                        bits = self._load_numeric(buf, nb_tx, max_item, nb_tokens)
+                    del buf
+                finally:
+                    mm.close()
+
+            # Items non numériques : tokenizer Python générique
+            if bits is None:
+                bits = self._load_python(filepath)
+
             if self.verbose:
                 print(f"Dataset: {filepath}")
                 print(f"Transactions: {self.nb_transactions}")
-                print(f"Items distincts: {len(item_tidset)}")
+                print(f"Items distincts: {self._nb_distinct}")
+                print(f"Mots uint64 par bitmap: {self.n_words}")
                 print(f"Support minimum: {self.min_support_count} ({self.min_support_ratio*100:.1f}%)")
-                
+
         except FileNotFoundError:
             print(f"ERREUR: Fichier '{filepath}' introuvable", file=sys.stderr)
             sys.exit(1)
         except Exception as e:
             print(f"ERREUR lors de la lecture du fichier: {e}", file=sys.stderr)
             sys.exit(1)
-            
-        return item_tidset
-    
-    def eclat_recursive(self, prefix: Tuple[str, ...], items: List[Tuple[str, Set[int]]]):
-        """
-        Fonction récursive ECLAT optimisée pour la mémoire
-        - Utilise des tuples au lieu de listes pour le préfixe (moins de mémoire)
-        - Ne stocke pas tous les itemsets, juste le compteur
-        - Libère la mémoire des tidsets dès que possible
-        
-        Args:
-            prefix: Préfixe de l'itemset courant (tuple immutable)
-            items: Liste de tuples (item, tidset) à explorer
-        """
-        for i in range(len(items)):
-            item, tidset = items[i]
-            support = len(tidset)
-            
-            if support >= self.min_support_count:
-                self.nb_frequent_itemsets += 1
-                
-                # Construire le suffix avec intersection
+
+        return bits
+
+    def _set_dimensions(self, nb_transactions: int):
+        """
+        Fixe les grandeurs dérivées du nombre de transactions
+        """
+        self.nb_transactions = nb_transactions
+        self.min_support_count = int(nb_transactions * self.min_support_ratio)
+        # Largeur de ligne arrondie à la ligne de cache ; les mots de
+        # bourrage restent à zéro (les kernels ne posent aucun bit
+        # au-delà de nb_transactions)
+        n_words = (nb_transactions + 63) // 64
+        self.n_words = (n_words + WORDS_ALIGN - 1) // WORDS_ALIGN * WORDS_ALIGN
+        self._sa_threshold = max(nb_transactions // 32, 1)
+        self._diff_threshold = int(nb_transactions * DIFF_RATIO)
+
+    def _load_numeric(self, buf: np.ndarray, nb_tx: int, max_item: int,
+                      nb_tokens: int) -> np.ndarray:
+        """
+        Chemin rapide : items entiers, l'ID d'un item est sa valeur.
+        Un kernel Numba parse les octets vers un CSR (indptr, indices)
+        transaction-major, un second empaquette le CSR en bitmaps.
+        """
+        self._set_dimensions(nb_tx)
+        self.id_to_item = [str(i) for i in range(max_item + 1)]
+        self.item_to_id = {item: i for i, item in enumerate(self.id_to_item)}
+
+        indptr = np.zeros(nb_tx + 1, dtype=np.int64)
+        indices = np.empty(nb_tokens, dtype=np.int32)
+        _parse_csr(buf, indptr, indices)
+
+        bits = _aligned_zeros(max_item + 1, self.n_words)
+        counts = np.zeros(max_item + 1, dtype=np.int64)
+        _bitmaps_from_csr(indptr, indices, bits, counts)
+        self._nb_distinct = int(np.count_nonzero(counts))
+        return bits
+
+    def _load_python(self, filepath: str) -> np.ndarray:
+        """
+        Chemin générique : tokenization Python ligne par ligne
+        (items arbitraires, encodés en IDs dans l'ordre d'apparition)
+        """
+        # Premier passage : collecter les TIDs par item (listes triées,
+        # les transactions arrivent dans l'ordre du fichier)
+        item_tids = defaultdict(list)
+
+        with open(filepath, 'r') as file:
+            for tid, line in enumerate(file):
+                items = line.strip().split()
+                for item in items:
+                    if item:
+                        item_tids[item].append(tid)
+
+        self._set_dimensions(tid + 1)
+
+        # Encodage des items en IDs entiers
+        self.id_to_item = list(item_tids.keys())
+        self.item_to_id = {item: i for i, item in enumerate(self.id_to_item)}
+        self._nb_distinct = len(self.id_to_item)
+
+        # Second passage : empaquetage en bitmaps (1 ligne par item)
+        bits = _aligned_zeros(len(item_tids), self.n_words)
+        for i, item in enumerate(self.id_to_item):
+            row = bits[i]
+            for tid in item_tids[item]:
+                row[tid >> 6] |= np.uint64(1) << np.uint64(tid & 63)
+
+        return bits
+
+    def _mine_emitting(self, bm_items: np.ndarray, item_supports: np.ndarray,
+                       order: np.ndarray) -> int:
+        """
+        Parcours DFS en Python pur qui appelle self.on_itemset pour
+        chaque motif fréquent : mémoire de travail en O(profondeur),
+        aucun motif matérialisé. Bien plus lent que les cœurs compilés
+        (qui ne savent que compter) — réservé aux usages qui veulent
+        les motifs eux-mêmes.
+
+        Returns:
+            Nombre de motifs émis (chaque motif une seule fois)
+        """
+        emit = self.on_itemset
+        min_sup = self.min_support_count
+        labels = [self.id_to_item[int(i)] for i in order]
+        total = 0
+
+        def walk(prefix, items):
+            nonlocal total
+            for idx, (label, bm, sup) in enumerate(items):
+                itemset = prefix + (label,)
+                emit(itemset, sup)
+                total += 1
                 suffix = []
-                for j in range(i + 1, len(items)):
-                    other_item, other_tidset = items[j]
-                    intersection = tidset & other_tidset
-                    
-                    if len(intersection) >= self.min_support_count:
-                        suffix.append((other_item, intersection))
-                
-                # Appel récursif si suffix non vide
+                for label2, bm2, _ in items[idx + 1:]:
+                    inter = bm & bm2
+                    s = int(np.bitwise_count(inter).sum())
+                    if s >= min_sup:
+                        suffix.append((label2, inter, s))
                 if suffix:
-                    new_prefix = prefix + (item,)
-                    self.eclat_recursive(new_prefix, suffix)
-                    
-                # Libérer la mémoire du suffix
-                del suffix
-    
+                    walk(itemset, suffix)
+
+        walk((), [(labels[i], bm_items[i], int(item_supports[i]))
+                  for i in range(len(labels))])
+        return total
+
     def mine(self, filepath: str) -> int:
         """
         Lance l'extraction des motifs fréquents
         Retourne uniquement le nombre d'itemsets (pas les itemsets eux-mêmes)
-        
+
         Args:
             filepath: Chemin vers le dataset
-            
+
         Returns:
             Nombre d'itemsets fréquents trouvés
         """
@@ -114,42 +1047,99 @@ class ECLATMiner:
             print(f"\n{'='*70}")
             print(f"Algorithme ECLAT - Benchmark de performance")
             print(f"{'='*70}\n")
-        
+
         start_time = time.time()
-        
+
         # Charger le dataset
-        item_tidset = self.load_dataset(filepath)
+        bits = self.load_dataset(filepath)
         load_time = time.time() - start_time
-        
+
         # Filtrer les items qui ne respectent pas le support minimum
-        frequent_1_itemsets = [
-            (item, tidset) 
-            for item, tidset in item_tidset.items() 
-            if len(tidset) >= self.min_support_count
-        ]
-        
-        # Libérer la mémoire de item_tidset
-        del item_tidset
+        # puis trier par support croissant (optimisation)
+        supports = np.array([popcount(bits[i]) for i in range(bits.shape[0])], dtype=np.int64)
+        frequent_ids = np.flatnonzero(supports >= self.min_support_count)
+        order = frequent_ids[np.argsort(supports[frequent_ids], kind='stable')]
+        k = len(order)
+
+        # Construire les tableaux du cœur compilé : bitmaps contigus,
+        # représentation SA pour les tidsets creux, et tables de mots
+        # non nuls pour les intersections bitmap asymétriques
+        bm_items = _aligned_zeros(k, self.n_words)
+        np.take(bits, order, axis=0, out=bm_items)
+        sa_cap = self._sa_threshold
+        sa_items = np.empty((k, sa_cap), dtype=np.uint32)
+        nz_items = np.empty((k, self.n_words), dtype=np.uint32)
+        nnz_items = np.empty(k, dtype=np.int32)
+        kinds = np.empty(k, dtype=np.int8)
+        item_supports = supports[order]
+        for idx in range(k):
+            nz = np.flatnonzero(bm_items[idx] != 0)
+            nnz_items[idx] = len(nz)
+            nz_items[idx, :len(nz)] = nz
+            if item_supports[idx] < self._sa_threshold:
+                bm_to_sa(bm_items[idx], sa_items[idx])
+                kinds[idx] = KIND_SA
+            else:
+                kinds[idx] = KIND_BITMAP
+
+        # Libérer la matrice complète
+        del bits
         gc.collect()
-        
+
         if self.verbose:
-            print(f"Items fréquents (1-itemsets): {len(frequent_1_itemsets)}")
+            print(f"Items fréquents (1-itemsets): {k}")
             print(f"Temps de chargement: {load_time:.3f}s\n")
             print(f"Extraction en cours...")
-        
-        # Trier par support croissant (optimisation)
-        frequent_1_itemsets.sort(key=lambda x: len(x[1]))
-        
+
         # Compter les 1-itemsets
-        self.nb_frequent_itemsets = len(frequent_1_itemsets)
-        
-        # Lancer ECLAT
+        self.nb_frequent_itemsets = k
+
+        # Lancer ECLAT (cœur compilé, sous-arbres du niveau 1 répartis
+        # sur les cœurs) : la passe par tuiles fournit les supports du
+        # niveau 2 en bloc
         mining_start = time.time()
-        self.eclat_recursive((), frequent_1_itemsets)
+        if self.on_itemset is not None:
+            # Chemin d'émission : les cœurs compilés ne font que compter,
+            # le flux des motifs passe par un parcours Python
+            self.nb_frequent_itemsets += self._mine_emitting(
+                bm_items, item_supports, order)
+        else:
+            if _HAS_CUDA:
+                l2 = level2_supports_gpu(bm_items)
+            else:
+                l2 = level2_supports(bm_items)
+
+            # Bascule dEclat : les tidsets quasi pleins passent en
+            # diffset (après la passe niveau 2, qui a besoin des
+            # bitmaps directs)
+            tail = self.nb_transactions & 63
+            last = (self.nb_transactions - 1) >> 6
+            for idx in range(k):
+                if item_supports[idx] > self._diff_threshold:
+                    np.invert(bm_items[idx], out=bm_items[idx])
+                    if tail:
+                        bm_items[idx, last] &= (np.uint64(1) << np.uint64(tail)) - np.uint64(1)
+                    bm_items[idx, last + 1:] = 0
+                    kinds[idx] = KIND_DIFF
+                    nnz_items[idx] = 0
+
+            if _HAS_CEXT:
+                self.nb_frequent_itemsets += int(_eclat_c.mine(
+                    bm_items, sa_items, nz_items, nnz_items, kinds, item_supports,
+                    l2, self.min_support_count, self._sa_threshold,
+                    self.nb_transactions, self._diff_threshold
+                ))
+            else:
+                core = _get_core(self.n_words)
+                self.nb_frequent_itemsets += int(core(
+                    bm_items, sa_items, nz_items, nnz_items, kinds, item_supports,
+                    l2, self.min_support_count, self._sa_threshold,
+                    self.nb_transactions, self._diff_threshold
+                ))
         mining_time = time.time() - mining_start
-        
+
         total_time = time.time() - start_time
-        
+
         if self.verbose:
             print(f"\n{'='*70}")
             print(f"RÉSULTATS")
@@ -162,7 +1152,7 @@ class ECLATMiner:
         else:
             # Mode compact pour benchmarking
             print(f"{filepath},{self.min_support_ratio},{self.nb_frequent_itemsets},{total_time:.3f}")
-        
+
         return self.nb_frequent_itemsets
 
 
@@ -183,48 +1173,48 @@ Exemples d'utilisation:
 Le mode --quiet affiche: dataset,support,nb_itemsets,temps(s)
         """
     )
-    
+
     parser.add_argument(
         'dataset',
         type=str,
         help='Chemin vers le fichier dataset'
     )
-    
+
     parser.add_argument(
         'min_support',
         type=float,
         help='Support minimum (entre 0 et 1, ex: 0.2 pour 20%%)'
     )
-    
+
     parser.add_argument(
         '-q', '--quiet',
         action='store_true',
         help='Mode silencieux (affiche uniquement les résultats en CSV)'
     )
-    
+
     parser.add_argument(
         '--timeout',
         type=int,
         default=1800,
         help='Timeout en secondes (défaut: 1800s = 30min)'
     )
-    
+
     args = parser.parse_args()
-    
+
     # Validation du support
     if not 0 < args.min_support <= 1:
         print("ERREUR: Le support minimum doit être entre 0 et 1", file=sys.stderr)
         sys.exit(1)
-    
+
     # Header CSV pour mode quiet
     if args.quiet:
         print("dataset,min_support,nb_itemsets,time_seconds")
-    
+
     # Exécuter ECLAT
     try:
         miner = ECLATMiner(min_support=args.min_support, verbose=not args.quiet)
         miner.mine(args.dataset)
-        
+
     except KeyboardInterrupt:
         print("\n\nInterruption par l'utilisateur", file=sys.stderr)
         sys.exit(1)
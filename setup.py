@@ -0,0 +1,21 @@
+"""
+Compilation du cœur C optionnel : python setup.py build_ext --inplace
+Sans l'extension, eclat_improved.py utilise son cœur Numba.
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension(
+        "_eclat",
+        ["_eclat.pyx"],
+        extra_compile_args=["-O3", "-fopenmp"],
+        extra_link_args=["-fopenmp"],
+    )
+]
+
+setup(
+    name="fim_eclat",
+    ext_modules=cythonize(extensions),
+)